@@ -0,0 +1,29 @@
+"""Poetry build script compiling the optional Cython speedups.
+
+The extensions are strictly optional: when Cython or a C compiler is
+missing the build silently produces a pure-Python wheel and the package
+falls back to the interpreted implementations at import time.
+"""
+
+
+def build(setup_kwargs: dict) -> None:
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Extension
+    except ImportError:
+        return
+
+    setup_kwargs.update(
+        ext_modules=cythonize(
+            [
+                Extension('raknet._serializer', ['raknet/_serializer.pyx']),
+                Extension('raknet._ids', ['raknet/_ids.pyx']),
+                Extension('raknet._strings', ['raknet/_strings.pyx']),
+            ],
+            language_level=3
+        ) + [
+            # Plain C, no Cython involved; listed here so all speedups
+            # share the one optional build path.
+            Extension('raknet._caddr', ['raknet/_caddr.c']),
+        ]
+    )
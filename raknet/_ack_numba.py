@@ -0,0 +1,41 @@
+"""Numba-compiled run segmentation for AcknowledgePacket.
+
+Importing this module requires numba; ``raknet.packet`` only uses it
+when the import succeeds, so the dependency stays optional.
+"""
+
+import numpy as np
+from numba import njit
+
+__all__ = [
+    'segment_runs'
+]
+
+
+@njit(cache=True)
+def segment_runs(packets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Split sorted packet ids into (starts, ends) of consecutive runs."""
+    count = packets.shape[0]
+    starts = np.empty(count, dtype=np.uint32)
+    ends = np.empty(count, dtype=np.uint32)
+
+    records = 0
+    start = packets[0]
+    last = packets[0]
+
+    for i in range(1, count):
+        current = packets[i]
+        diff = current - last
+        if diff == 1:
+            last = current
+        elif diff > 1:
+            starts[records] = start
+            ends[records] = last
+            records += 1
+            start = last = current
+
+    starts[records] = start
+    ends[records] = last
+    records += 1
+
+    return starts[:records], ends[:records]
@@ -0,0 +1,88 @@
+/* Optional compiled speedup (see build.py): a PyStructSequence flavour
+ * of InternetAddress. The instances are fixed-size tuples with named
+ * fields, so construction, hashing and comparison all run the C tuple
+ * paths with no interpreted frame, and __match_args__ comes for free.
+ *
+ * This type deliberately does not replace raknet.other.InternetAddress:
+ * the Python class carries the packed key, the flyweight pool and the
+ * cached wire encoding, none of which a bare struct sequence can hold.
+ * It is for callers that only need (ip, port, version) records in bulk.
+ */
+#include <Python.h>
+
+static PyStructSequence_Field address_fields[] = {
+    {"ip", "String form of the IP address."},
+    {"port", "UDP port number."},
+    {"version", "IP version, 4 or 6."},
+    {NULL, NULL}
+};
+
+static PyStructSequence_Desc address_desc = {
+    "raknet._caddr.InternetAddress",
+    "InternetAddress(ip, port, version) as a named fixed-size tuple.",
+    address_fields,
+    3
+};
+
+static PyTypeObject *InternetAddress_Type = NULL;
+
+static PyObject *
+caddr_make(PyObject *Py_UNUSED(module), PyObject *args)
+{
+    PyObject *ip;
+    PyObject *port;
+    PyObject *version;
+    PyObject *result;
+
+    if (!PyArg_ParseTuple(args, "UO!O!:make",
+                          &ip, &PyLong_Type, &port, &PyLong_Type, &version)) {
+        return NULL;
+    }
+    result = PyStructSequence_New(InternetAddress_Type);
+    if (result == NULL) {
+        return NULL;
+    }
+    Py_INCREF(ip);
+    PyStructSequence_SET_ITEM(result, 0, ip);
+    Py_INCREF(port);
+    PyStructSequence_SET_ITEM(result, 1, port);
+    Py_INCREF(version);
+    PyStructSequence_SET_ITEM(result, 2, version);
+    return result;
+}
+
+static PyMethodDef caddr_methods[] = {
+    {"make", caddr_make, METH_VARARGS,
+     "make(ip, port, version) -> InternetAddress"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef caddr_module = {
+    PyModuleDef_HEAD_INIT,
+    "raknet._caddr",
+    "Compiled struct-sequence address records.",
+    -1,
+    caddr_methods,
+    NULL, NULL, NULL, NULL
+};
+
+PyMODINIT_FUNC
+PyInit__caddr(void)
+{
+    PyObject *module = PyModule_Create(&caddr_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    InternetAddress_Type = PyStructSequence_NewType(&address_desc);
+    if (InternetAddress_Type == NULL) {
+        Py_DECREF(module);
+        return NULL;
+    }
+    if (PyModule_AddObject(module, "InternetAddress",
+                           (PyObject *)InternetAddress_Type) < 0) {
+        Py_DECREF(InternetAddress_Type);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
@@ -0,0 +1,65 @@
+# cython: language_level=3
+"""Compiled message-id constants.
+
+Mirrors ``raknet.other.MessageIdentifiers`` as a cdef enum so that
+cdef-annotated parsing code can compare packet ids as pure C ints with
+no attribute lookup; the ``cpdef`` form also exposes the members as
+plain module-level ints for Python callers. The IntEnum in
+``raknet.other`` stays the source of truth for interpreted code.
+
+Optional module, built alongside the other speedups (see build.py).
+"""
+
+cpdef enum MessageID:
+    CONNECTED_PING = 0x00
+    UNCONNECTED_PING = 0x01
+    UNCONNECTED_PING_OPEN_CONNECTIONS = 0x02
+    CONNECTED_PONG = 0x03
+    OPEN_CONNECTION_REQUEST_ONE = 0x05
+    OPEN_CONNECTION_REPLY_ONE = 0x06
+    OPEN_CONNECTION_REQUEST_TWO = 0x07
+    OPEN_CONNECTION_REPLY_TWO = 0x08
+    CONNECTION_REQUEST = 0x09
+    CONNECTION_REQUEST_ACCEPTED = 0x10
+    NEW_INCOMING_CONNECTION = 0x13
+    DISCONNECT_NOTIFICATION = 0x15
+    INCOMPATIBLE_PROTOCOL_VERSION = 0x19
+    UNCONNECTED_PONG = 0x1c
+    ADVERTISE_SYSTEM = 0x1d
+
+
+cpdef str name_of(int mid):
+    # The if-ladder over constant ints lowers to a C switch (a dense jump
+    # table after optimization), so this is O(1) with no dict or hashing.
+    if mid == MessageID.CONNECTED_PING:
+        return 'CONNECTED_PING'
+    elif mid == MessageID.UNCONNECTED_PING:
+        return 'UNCONNECTED_PING'
+    elif mid == MessageID.UNCONNECTED_PING_OPEN_CONNECTIONS:
+        return 'UNCONNECTED_PING_OPEN_CONNECTIONS'
+    elif mid == MessageID.CONNECTED_PONG:
+        return 'CONNECTED_PONG'
+    elif mid == MessageID.OPEN_CONNECTION_REQUEST_ONE:
+        return 'OPEN_CONNECTION_REQUEST_ONE'
+    elif mid == MessageID.OPEN_CONNECTION_REPLY_ONE:
+        return 'OPEN_CONNECTION_REPLY_ONE'
+    elif mid == MessageID.OPEN_CONNECTION_REQUEST_TWO:
+        return 'OPEN_CONNECTION_REQUEST_TWO'
+    elif mid == MessageID.OPEN_CONNECTION_REPLY_TWO:
+        return 'OPEN_CONNECTION_REPLY_TWO'
+    elif mid == MessageID.CONNECTION_REQUEST:
+        return 'CONNECTION_REQUEST'
+    elif mid == MessageID.CONNECTION_REQUEST_ACCEPTED:
+        return 'CONNECTION_REQUEST_ACCEPTED'
+    elif mid == MessageID.NEW_INCOMING_CONNECTION:
+        return 'NEW_INCOMING_CONNECTION'
+    elif mid == MessageID.DISCONNECT_NOTIFICATION:
+        return 'DISCONNECT_NOTIFICATION'
+    elif mid == MessageID.INCOMPATIBLE_PROTOCOL_VERSION:
+        return 'INCOMPATIBLE_PROTOCOL_VERSION'
+    elif mid == MessageID.UNCONNECTED_PONG:
+        return 'UNCONNECTED_PONG'
+    elif mid == MessageID.ADVERTISE_SYSTEM:
+        return 'ADVERTISE_SYSTEM'
+    else:
+        return f'UNKNOWN_{mid:#04x}'
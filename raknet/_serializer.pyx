@@ -0,0 +1,189 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled PacketSerializer.
+
+Drop-in replacement for the pure-Python ``PacketSerializer`` in
+``raknet.packet``. Every field read lowers to a couple of C byte loads
+combined with shifts (which compilers collapse into a single bswap),
+instead of a chain of Python method calls on ``BinaryStream``.
+
+This module is optional: it is only built when Cython and a C compiler
+are available (see ``build.py``), and ``raknet.packet`` falls back to
+the pure-Python implementation when the import fails.
+"""
+
+import socket
+
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
+
+from binary import ByteOrder
+
+from .other import InternetAddress
+
+
+cdef object _LITTLE_ENDIAN = ByteOrder.LITTLE_ENDIAN
+cdef object _BIG_ENDIAN = ByteOrder.BIG_ENDIAN
+
+
+cdef class PacketSerializer:
+    cdef public bytearray buffer
+    cdef public Py_ssize_t offset
+
+    def __init__(self, buffer=b'', Py_ssize_t offset=0):
+        self.buffer = bytearray(buffer)
+        self.offset = offset
+
+    cdef inline const unsigned char* _ptr(self, Py_ssize_t need) except NULL:
+        if self.offset + need > len(self.buffer):
+            raise EOFError(f'Not enough bytes left in buffer (need {need})')
+        return <const unsigned char*> self.buffer + self.offset
+
+    cpdef bint feos(self):
+        return self.offset >= len(self.buffer)
+
+    cpdef bytes read(self, Py_ssize_t length):
+        cdef const unsigned char* p = self._ptr(length)
+        self.offset += length
+        return p[:length]
+
+    cpdef void write(self, data):
+        self.buffer += data
+
+    cpdef bint read_bool(self):
+        return self._read_byte() != 0
+
+    cpdef void write_bool(self, bint value):
+        self.buffer.append(1 if value else 0)
+
+    cdef inline uint8_t _read_byte(self) except? 0xff:
+        cdef const unsigned char* p = self._ptr(1)
+        self.offset += 1
+        return p[0]
+
+    cpdef unsigned int read_byte(self):
+        return self._read_byte()
+
+    cpdef void write_byte(self, unsigned int value):
+        self.buffer.append(value & 0xff)
+
+    cpdef unsigned int read_short(self, object order=_BIG_ENDIAN):
+        cdef const unsigned char* p = self._ptr(2)
+        cdef uint16_t result
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            result = p[0] | (<uint16_t> p[1] << 8)
+        else:
+            result = (<uint16_t> p[0] << 8) | p[1]
+        self.offset += 2
+        return result
+
+    cpdef void write_short(self, unsigned int value, object order=_BIG_ENDIAN):
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            self.buffer.append(value & 0xff)
+            self.buffer.append((value >> 8) & 0xff)
+        else:
+            self.buffer.append((value >> 8) & 0xff)
+            self.buffer.append(value & 0xff)
+
+    cpdef unsigned int read_triad(self, object order=_BIG_ENDIAN):
+        cdef const unsigned char* p = self._ptr(3)
+        cdef uint32_t result
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            result = p[0] | (<uint32_t> p[1] << 8) | (<uint32_t> p[2] << 16)
+        else:
+            result = (<uint32_t> p[0] << 16) | (<uint32_t> p[1] << 8) | p[2]
+        self.offset += 3
+        return result
+
+    cpdef void write_triad(self, unsigned int value, object order=_BIG_ENDIAN):
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            self.buffer.append(value & 0xff)
+            self.buffer.append((value >> 8) & 0xff)
+            self.buffer.append((value >> 16) & 0xff)
+        else:
+            self.buffer.append((value >> 16) & 0xff)
+            self.buffer.append((value >> 8) & 0xff)
+            self.buffer.append(value & 0xff)
+
+    cpdef unsigned long read_int(self, object order=_BIG_ENDIAN):
+        cdef const unsigned char* p = self._ptr(4)
+        cdef uint32_t result
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            result = (p[0] | (<uint32_t> p[1] << 8) |
+                      (<uint32_t> p[2] << 16) | (<uint32_t> p[3] << 24))
+        else:
+            result = ((<uint32_t> p[0] << 24) | (<uint32_t> p[1] << 16) |
+                      (<uint32_t> p[2] << 8) | p[3])
+        self.offset += 4
+        return result
+
+    cpdef void write_int(self, unsigned long value, object order=_BIG_ENDIAN):
+        cdef int shift
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            for shift in range(0, 32, 8):
+                self.buffer.append((value >> shift) & 0xff)
+        else:
+            for shift in range(24, -8, -8):
+                self.buffer.append((value >> shift) & 0xff)
+
+    cpdef unsigned long long read_long(self, object order=_BIG_ENDIAN):
+        cdef const unsigned char* p = self._ptr(8)
+        cdef uint64_t result = 0
+        cdef int i
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            for i in range(8):
+                result |= <uint64_t> p[i] << (i * 8)
+        else:
+            for i in range(8):
+                result = (result << 8) | p[i]
+        self.offset += 8
+        return result
+
+    cpdef void write_long(self, unsigned long long value, object order=_BIG_ENDIAN):
+        cdef int shift
+        if order is _LITTLE_ENDIAN or order == _LITTLE_ENDIAN:
+            for shift in range(0, 64, 8):
+                self.buffer.append((value >> shift) & 0xff)
+        else:
+            for shift in range(56, -8, -8):
+                self.buffer.append((value >> shift) & 0xff)
+
+    cpdef str read_string(self):
+        return self.read(self.read_short()).decode('ascii')
+
+    cpdef void write_string(self, str value):
+        self.write_short(len(value))
+        self.write(value.encode('ascii'))
+
+    cpdef object read_address(self):
+        cdef unsigned int version = self._read_byte()
+        cdef const unsigned char* p
+        if version == 4:
+            p = self._ptr(4)
+            ip = '%d.%d.%d.%d' % (~p[0] & 0xff, ~p[1] & 0xff, ~p[2] & 0xff, ~p[3] & 0xff)
+            self.offset += 4
+            port = self.read_short()
+            return InternetAddress(ip, port, version)
+        elif version == 6:
+            self.read_short(order=_LITTLE_ENDIAN)
+            port = self.read_short()
+
+            self.read_int()
+            ip = socket.inet_ntop(socket.AF_INET6, self.read(16))
+
+            self.read_int()
+            return InternetAddress(ip, port, version)
+        else:
+            raise ValueError(f'Unknown IP address version: {version}')
+
+    cpdef void write_address(self, object value):
+        self.write_byte(value.version)
+        if value.version == 4:
+            for part in value.ip.split('.'):
+                self.write_byte(~int(part) & 0xff)
+            self.write_short(value.port)
+        elif value.version == 6:
+            self.write_short(socket.AF_INET6, order=_LITTLE_ENDIAN)
+            self.write_short(value.port)
+
+            self.write_int(0)
+            self.write(socket.inet_pton(socket.AF_INET6, value.ip))
+            self.write_int(0)
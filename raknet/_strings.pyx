@@ -0,0 +1,26 @@
+# cython: language_level=3
+"""Compiled disconnect-reason formatting.
+
+The dense reason codes index straight into a C-level tuple, so the
+lookup is a bounds check plus one array load - no hashing and no
+interpreted frame. ``raknet.other.DisconnectReason.to_string`` prefers
+this function when the extension was built.
+"""
+
+cdef tuple _REASON_STRINGS = (
+    "client disconnect",
+    "server disconnect",
+    "timeout",
+    "new session established on same address and port",
+    "server shutdown",
+    "received packet split into more parts than allowed",
+    "too many received split packets being reassembled at once",
+    "invalid split packet part index",
+    "received split packet header inconsistent with previous fragments",
+)
+
+
+cpdef str disconnect_reason_to_string(int reason):
+    if 0 <= reason < 9:
+        return <str> _REASON_STRINGS[reason]
+    return f'Unknown reason {reason}'
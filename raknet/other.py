@@ -1,39 +1,194 @@
+import ipaddress
 import time
-from typing import Final, Self
+import weakref
+from enum import IntEnum
+from functools import lru_cache
+from typing import Callable, Final, Self, final
 
 __all__ = [
     'InternetAddress',
+    'PeerTable',
     'ProtocolAcceptor',
     'DisconnectReason',
-    'MessageIdentifiers'
+    'MessageIdentifiers',
+    'register'
 ]
 
+try:
+    # Optional speedup: PeerTable sweeps are vectorized when numpy is
+    # installed (pip install raknet[speedups]).
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional compiled speedup (see build.py); DisconnectReason.to_string
+    # falls back to its match statement when the extension was not built.
+    from ._strings import disconnect_reason_to_string as _reason_to_string
+except ImportError:
+    _reason_to_string = None
+
+
+# typing.Final is not a legal base class (it raises TypeError at class
+# creation on current Python); the decorator is the runtime-free way to mark
+# these types final, and dropping the base lets __slots__ actually remove
+# the per-instance __dict__.
+@final
+class InternetAddress:
+    # __weakref__ keeps the instances poolable by the weak-valued factory
+    # below despite the missing __dict__.
+    __slots__ = ('ip', 'port', 'version', 'packed', 'sockaddr', '_str', '_wire',
+                 '__weakref__')
+    # Lets case InternetAddress(ip, port, _) bind positionally, straight
+    # off the slots.
+    __match_args__ = ('ip', 'port', 'version')
 
-class InternetAddress(Final):
     def __init__(self, ip: str, port: int, version: int):
         self.ip = ip
         self.port = port
         self.version = version
+        # Single-integer form of (ip, port, version); hashing and equality
+        # work on this machine word instead of re-hashing the ip string on
+        # every peer-table probe, and it can be used directly as a dict key.
+        self.packed = (int(ipaddress.ip_address(ip)) << 20) | (port << 4) | version
+        # Ready-made (ip, port) tuple for socket.sendto, so send paths never
+        # rebuild it per datagram.
+        self.sockaddr = (ip, port)
+        # Addresses are treated as immutable, so the formatted string and the
+        # RakNet wire encoding (filled in by PacketSerializer.write_address)
+        # are computed at most once per instance.
+        self._str = None
+        self._wire = None
+
+    @classmethod
+    def get(cls, ip: str, port: int, version: int) -> Self:
+        """Return a pooled instance for this endpoint.
+
+        Receive paths see the same few endpoints over and over; routing
+        construction through the pool makes repeat lookups return the
+        one existing object (and its cached packed/str/wire forms)
+        instead of re-running __init__ per datagram.
+        """
+        return _get_address(ip, port, version)
+
+    @classmethod
+    def from_packed(cls, key: int) -> Self:
+        version = key & 0xf
+        port = (key >> 4) & 0xffff
+        ip = key >> 20
+        if version == 6:
+            return cls(str(ipaddress.IPv6Address(ip)), port, version)
+        return cls(str(ipaddress.IPv4Address(ip)), port, version)
+
+    def __eq__(self, other: object) -> bool:
+        # type() identity instead of isinstance: the class is final, so one
+        # pointer compare suffices and foreign types defer correctly via
+        # NotImplemented instead of raising on missing attributes.
+        if type(other) is not InternetAddress:
+            return NotImplemented
+        # Identity next: peer tables mostly probe with the same object
+        # they stored, which skips even the integer compare.
+        return self is other or self.packed == other.packed
 
-    def __eq__(self, other: Self) -> bool:
-        return self.ip == other.ip and self.port == other.port and self.version == other.version
+    def __hash__(self) -> int:
+        return self.packed
 
     def __str__(self) -> str:
-        return f'{self.ip} {self.port}'
+        result = self._str
+        if result is None:
+            # %-formatting over the f-string: %s/%d hit the str/int fast
+            # paths directly instead of going through __format__.
+            result = self._str = '%s %d' % (self.ip, self.port)
+        return result
 
     def __copy__(self) -> Self:
         return InternetAddress(self.ip, self.port, self.version)
 
 
-class ProtocolAcceptor(Final):
+# Flyweight pool behind InternetAddress.get. The weak-valued dict lets
+# idle endpoints be collected as usual, while the lru_cache in front
+# holds strong references to the 1024 hottest ones so repeat peers skip
+# even the weak-dict probe.
+_ADDRESS_POOL: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=1024)
+def _get_address(ip: str, port: int, version: int) -> InternetAddress:
+    key = (ip, port, version)
+    address = _ADDRESS_POOL.get(key)
+    if address is None:
+        address = _ADDRESS_POOL[key] = InternetAddress(ip, port, version)
+    return address
+
+
+@final
+class PeerTable:
+    """Struct-of-arrays view over connected peers for timeout sweeps.
+
+    Iterating InternetAddress objects to find timed-out peers chases a
+    pointer per peer; here the per-peer fields live in parallel numpy
+    arrays instead, so one vectorized compare over ``last_seen`` replaces
+    the whole Python loop. Rows are keyed by ``InternetAddress.packed``,
+    and ``keys[row]`` maps a row back to its packed address (feed it to
+    ``InternetAddress.from_packed`` when the full address is needed).
+    """
+
+    __slots__ = ('capacity', 'size', 'ips', 'ports', 'last_seen', 'keys', '_rows')
+
+    def __init__(self, capacity: int = 64):
+        if np is None:
+            raise RuntimeError('PeerTable requires numpy (pip install raknet[speedups])')
+        self.capacity = capacity
+        self.size = 0
+        # uint32 only holds an IPv4 address; IPv6 peers keep 0 here and
+        # are recovered through keys[row] like everything else.
+        self.ips = np.zeros(capacity, dtype=np.uint32)
+        self.ports = np.zeros(capacity, dtype=np.uint16)
+        self.last_seen = np.zeros(capacity, dtype=np.float64)
+        self.keys: list[int] = []
+        self._rows: dict[int, int] = {}
+
+    def add(self, address: InternetAddress) -> int:
+        row = self._rows.get(address.packed)
+        if row is not None:
+            self.last_seen[row] = time.time()
+            return row
+        if self.size == self.capacity:
+            self.capacity *= 2
+            self.ips = np.resize(self.ips, self.capacity)
+            self.ports = np.resize(self.ports, self.capacity)
+            self.last_seen = np.resize(self.last_seen, self.capacity)
+        row = self.size
+        self.size = row + 1
+        if address.version == 4:
+            self.ips[row] = address.packed >> 20
+        self.ports[row] = address.port
+        self.last_seen[row] = time.time()
+        self.keys.append(address.packed)
+        self._rows[address.packed] = row
+        return row
+
+    def touch(self, row: int, now: float) -> None:
+        self.last_seen[row] = now
+
+    def sweep(self, now: float, timeout: float):
+        # One SIMD compare over the live rows instead of a Python loop;
+        # returns the row indices of every peer past its timeout.
+        return np.nonzero(now - self.last_seen[:self.size] > timeout)[0]
+
+
+@final
+class ProtocolAcceptor:
+    __slots__ = ('version', 'accepts')
+
     def __init__(self, version: int):
         self.version = version
-
-    def accepts(self, version: int) -> bool:
-        return version == self.version
+        # Bind int.__eq__ directly: acceptor.accepts(version) then runs the
+        # C-level integer compare without an interpreted frame in between.
+        self.accepts = version.__eq__
 
 
-class DisconnectReason(Final):
+class DisconnectReason(IntEnum):
     CLIENT_DISCONNECT = 0x00
     SERVER_DISCONNECT = 0x01
     PEER_TIMEOUT = 0x02
@@ -46,20 +201,24 @@ class DisconnectReason(Final):
 
     @staticmethod
     def to_string(reason: int):
-        return {
-            DisconnectReason.CLIENT_DISCONNECT: "client disconnect",
-            DisconnectReason.SERVER_DISCONNECT: "server disconnect",
-            DisconnectReason.PEER_TIMEOUT: "timeout",
-            DisconnectReason.CLIENT_RECONNECT: "new session established on same address and port",
-            DisconnectReason.SERVER_SHUTDOWN: "server shutdown",
-            DisconnectReason.SPLIT_PACKET_TOO_LARGE: "received packet split into more parts than allowed",
-            DisconnectReason.SPLIT_PACKET_TOO_MANY_CONCURRENT: "too many received split packets being reassembled at once",
-            DisconnectReason.SPLIT_PACKET_INVALID_PART_INDEX: "invalid split packet part index",
-            DisconnectReason.SPLIT_PACKET_INCONSISTENT_HEADER: "received split packet header inconsistent with previous fragments",
-        }.get(reason, f"Unknown reason {reason}")
-
-
-class MessageIdentifiers(Final):
+        if _reason_to_string is not None:
+            return _reason_to_string(reason)
+        # match over literal ints: no table to allocate or index, and the
+        # adaptive interpreter specializes the integer compares.
+        match reason:
+            case 0x00: return "client disconnect"
+            case 0x01: return "server disconnect"
+            case 0x02: return "timeout"
+            case 0x03: return "new session established on same address and port"
+            case 0x04: return "server shutdown"
+            case 0x05: return "received packet split into more parts than allowed"
+            case 0x06: return "too many received split packets being reassembled at once"
+            case 0x07: return "invalid split packet part index"
+            case 0x08: return "received split packet header inconsistent with previous fragments"
+            case _: return f"Unknown reason {reason}"
+
+
+class MessageIdentifiers(IntEnum):
     ###
     # RESERVED TYPES - DO NOT CHANGE THESE
     # All types from RakPeer
@@ -111,7 +270,29 @@ class MessageIdentifiers(Final):
     # the data parameter
     ADVERTISE_SYSTEM = 0x1d
 
-class ReliableCacheEntry(Final):
+# Message ids are dense small ints (all members above are < 0x20), so
+# dispatch is a flat list indexed by id: one array load instead of an
+# elif chain or dict probe per received packet. Slots left unregistered
+# stay None; the receive loop is
+#
+#     handler = _HANDLERS[pid]
+#     if handler is not None:
+#         handler(buffer)
+MAX_MESSAGE_ID: Final[int] = 0x20
+_HANDLERS: list[Callable | None] = [None] * MAX_MESSAGE_ID
+
+
+def register(mid: int) -> Callable:
+    def decorator(handler: Callable) -> Callable:
+        _HANDLERS[mid] = handler
+        return handler
+    return decorator
+
+
+@final
+class ReliableCacheEntry:
+    __slots__ = ('timestamp', 'packets')
+
     timestamp: float
     packets: list
 
@@ -1,9 +1,24 @@
 import socket
+import struct
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from queue import Empty, SimpleQueue
 from typing import Self
 
 from binary import BinaryStream, ByteOrder
 
+try:
+    # Optional: vectorizes the per-tick ACK/NACK record scans.
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Optional: JIT-compiles the run segmentation on top of the numpy path.
+    from ._ack_numba import segment_runs
+except ImportError:
+    segment_runs = None
+
 from .other import InternetAddress
 
 __all__ = [
@@ -12,7 +27,8 @@ __all__ = [
     'OfflinePacket',
     'AcknowledgePacket',
     'PacketReliability',
-    'PacketSerializer'
+    'PacketSerializer',
+    'serializer_pool'
 ]
 
 
@@ -28,30 +44,82 @@ class PacketReliability:
 
     @staticmethod
     def is_reliable(reliability: int) -> bool:
-        return reliability not in [
-            PacketReliability.UNRELIABLE,
-            PacketReliability.UNRELIABLE_SEQUENCED,
-            PacketReliability.UNRELIABLE_WITH_ACK_RECEIPT
-        ]
+        return bool((1 << reliability) & _RELIABLE_MASK)
 
     @staticmethod
     def is_ordered(reliability: int) -> bool:
-        return reliability in [
-            PacketReliability.UNRELIABLE_SEQUENCED,
-            PacketReliability.RELIABLE_ORDERED,
-            PacketReliability.RELIABLE_SEQUENCED,
-            PacketReliability.RELIABLE_ORDERED_WITH_ACK_RECEIPT
-        ]
+        return bool((1 << reliability) & _ORDERED_MASK)
 
     @staticmethod
     def is_sequenced(reliability: int) -> bool:
-        return reliability in [
-            PacketReliability.UNRELIABLE_SEQUENCED,
-            PacketReliability.RELIABLE_SEQUENCED,
-        ]
+        return bool((1 << reliability) & _SEQUENCED_MASK)
+
+
+# Bit masks over the 3-bit reliability values so the predicates above are a
+# single shift + AND instead of a per-call list build and linear scan.
+_RELIABLE_MASK = (
+    (1 << PacketReliability.RELIABLE) |
+    (1 << PacketReliability.RELIABLE_ORDERED) |
+    (1 << PacketReliability.RELIABLE_SEQUENCED) |
+    (1 << PacketReliability.RELIABLE_WITH_ACK_RECEIPT) |
+    (1 << PacketReliability.RELIABLE_ORDERED_WITH_ACK_RECEIPT)
+)
+_ORDERED_MASK = (
+    (1 << PacketReliability.UNRELIABLE_SEQUENCED) |
+    (1 << PacketReliability.RELIABLE_ORDERED) |
+    (1 << PacketReliability.RELIABLE_SEQUENCED) |
+    (1 << PacketReliability.RELIABLE_ORDERED_WITH_ACK_RECEIPT)
+)
+_SEQUENCED_MASK = (
+    (1 << PacketReliability.UNRELIABLE_SEQUENCED) |
+    (1 << PacketReliability.RELIABLE_SEQUENCED)
+)
+
+
+# Byte-inversion table for the obfuscated IPv4 addresses on the wire;
+# bytes.translate runs the whole inversion in one C loop.
+_INVERT: bytes = bytes(i ^ 0xff for i in range(256))
+
+# Precompiled field codecs; Struct.unpack_from/pack skip the per-call
+# format-string lookup inside the struct module.
+_U16BE = struct.Struct('>H')
+_U16LE = struct.Struct('<H')
+_U64BE = struct.Struct('>Q')
+_U64LE = struct.Struct('<Q')
 
 
 class PacketSerializer(BinaryStream):
+    def read_short(self, order: ByteOrder = ByteOrder.BIG_ENDIAN) -> int:
+        codec = _U16LE if order == ByteOrder.LITTLE_ENDIAN else _U16BE
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 2
+        return value
+
+    def write_short(self, value: int, order: ByteOrder = ByteOrder.BIG_ENDIAN) -> None:
+        codec = _U16LE if order == ByteOrder.LITTLE_ENDIAN else _U16BE
+        self.write(codec.pack(value))
+
+    def read_triad(self, order: ByteOrder = ByteOrder.BIG_ENDIAN) -> int:
+        value = int.from_bytes(
+            self.buffer[self.offset:self.offset + 3],
+            'little' if order == ByteOrder.LITTLE_ENDIAN else 'big'
+        )
+        self.offset += 3
+        return value
+
+    def write_triad(self, value: int, order: ByteOrder = ByteOrder.BIG_ENDIAN) -> None:
+        self.write(value.to_bytes(3, 'little' if order == ByteOrder.LITTLE_ENDIAN else 'big'))
+
+    def read_long(self, order: ByteOrder = ByteOrder.BIG_ENDIAN) -> int:
+        codec = _U64LE if order == ByteOrder.LITTLE_ENDIAN else _U64BE
+        value = codec.unpack_from(self.buffer, self.offset)[0]
+        self.offset += 8
+        return value
+
+    def write_long(self, value: int, order: ByteOrder = ByteOrder.BIG_ENDIAN) -> None:
+        codec = _U64LE if order == ByteOrder.LITTLE_ENDIAN else _U64BE
+        self.write(codec.pack(value))
+
     def read_string(self) -> str:
         return self.read(self.read_short()).decode('ascii')
 
@@ -62,10 +130,7 @@ class PacketSerializer(BinaryStream):
     def read_address(self) -> InternetAddress:
         version = self.read_byte()
         if version == 4:
-            network_ids = []
-            for _ in range(4):
-                network_ids.append(str(~self.read_byte() & 0xff))
-            ip = '.'.join(network_ids)
+            ip = socket.inet_ntoa(self.read(4).translate(_INVERT))
             port = self.read_short()
             return InternetAddress(ip, port, version)
         elif version == 6:
@@ -81,22 +146,82 @@ class PacketSerializer(BinaryStream):
             raise ValueError(f'Unknown IP address version: {version}')
 
     def write_address(self, value: InternetAddress) -> None:
-        self.write_byte(value.version)
-        if value.version == 4:
-            network_ids = value.ip.split('.')
-            for part in network_ids:
-                self.write_byte(~int(part) & 0xff)
-            self.write_short(value.port)
-        elif value.version == 6:
-            self.write_short(socket.AF_INET6, order=ByteOrder.LITTLE_ENDIAN)
-            self.write_short(value.port)
+        # Addresses are immutable, so the wire form is encoded once and
+        # cached on the instance; repeat sends of the same address append
+        # the cached bytes with no version branch or per-field encoding.
+        wire = value._wire
+        if wire is None:
+            if value.version == 4:
+                wire = (
+                    b'\x04'
+                    + socket.inet_aton(value.ip).translate(_INVERT)
+                    + value.port.to_bytes(2, 'big')
+                )
+            elif value.version == 6:
+                wire = (
+                    b'\x06'
+                    + int(socket.AF_INET6).to_bytes(2, 'little')
+                    + value.port.to_bytes(2, 'big')
+                    + b'\x00\x00\x00\x00'
+                    + socket.inet_pton(socket.AF_INET6, value.ip)
+                    + b'\x00\x00\x00\x00'
+                )
+            else:
+                wire = bytes([value.version & 0xff])
+            value._wire = wire
+        self.write(wire)
+
+
+try:
+    # Optional Cython speedups (see build.py); the pure-Python class above
+    # remains the fallback when the extension was not built.
+    from ._serializer import PacketSerializer  # noqa: F811
+except ImportError:
+    pass
+
+
+class _SerializerPool:
+    """Bounded pool of PacketSerializer scratch objects.
+
+    Encode paths borrow a serializer instead of constructing one per
+    packet, so the backing bytearray is reused rather than reallocated
+    on every send.
+    """
 
-            self.write_int(0)
-            self.write(socket.inet_pton(socket.AF_INET6, value.ip))
-            self.write_int(0)
+    MAX_POOLED = 64
+
+    def __init__(self):
+        self._queue = SimpleQueue()
+
+    def acquire(self) -> PacketSerializer:
+        try:
+            serializer = self._queue.get_nowait()
+        except Empty:
+            return PacketSerializer()
+
+        serializer.buffer.clear()
+        serializer.offset = 0
+        return serializer
+
+    def release(self, serializer: PacketSerializer) -> None:
+        if self._queue.qsize() < self.MAX_POOLED:
+            self._queue.put(serializer)
+
+    @contextmanager
+    def borrow(self):
+        serializer = self.acquire()
+        try:
+            yield serializer
+        finally:
+            self.release(serializer)
+
+
+serializer_pool = _SerializerPool()
 
 
 class Packet(ABC):
+    __slots__ = ()
+
     ID: int = -1
 
     @classmethod
@@ -127,91 +252,188 @@ class Packet(ABC):
         self.decode_payload(__in)
 
 
+# Magic bytes used to distinguish offline messages from loose garbage.
+_MAGIC: bytes = b"\x00\xff\xff\x00\xfe\xfe\xfe\xfe\xfd\xfd\xfd\xfd\x12\x34\x56\x78"
+
+
 class OfflinePacket(Packet, ABC):
-    # Magic bytes used to distinguish offline messages from loose garbage.
-    magic: bytes = b"\x00\xff\xff\x00\xfe\xfe\xfe\xfe\xfd\xfd\xfd\xfd\x12\x34\x56\x78"
+    __slots__ = ('magic',)
+
+    magic: bytes
+
+    def __init__(self):
+        self.magic = _MAGIC
 
     def read_magic(self, __in: BinaryStream):
-        self.magic = __in.read(16)
+        # Compare against the stream buffer in place and share the module
+        # constant on the (overwhelmingly common) valid path, so is_valid
+        # is a pointer compare and only garbage traffic pays for a copy.
+        offset = __in.offset
+        view = memoryview(__in.buffer)[offset:offset + 16]
+        __in.offset = offset + 16
+        self.magic = _MAGIC if view == _MAGIC else bytes(view)
 
     def write_magic(self, __out: BinaryStream) -> None:
         __out.write(self.magic)
 
     def is_valid(self) -> bool:
-        return self.magic == b'\x00\xff\xff\x00\xfe\xfe\xfe\xfe\xfd\xfd\xfd\xfd\x12\x34\x56\x78'
+        return self.magic is _MAGIC or self.magic == _MAGIC
 
 
 class OnlinePacket(Packet, ABC):
-    pass
+    __slots__ = ()
 
 
 class AcknowledgePacket(Packet):
     RECORD_TYPE_RANGE = 0x00
     RECORD_TYPE_SINGLE = 0x01
 
-    packets: list[int] = []
+    __slots__ = ('packets',)
+
+    packets: list[int]
+
+    def __init__(self):
+        self.packets = []
 
     def encode_payload(self, __out: PacketSerializer) -> None:
-        payload = BinaryStream()
         self.packets.sort()
 
         count = len(self.packets)
-        records = 0
-
-        if count > 0:
-            pointer = 1
-            start = self.packets[0]
-            last = self.packets[0]
-
-            while pointer < count:
-                current = self.packets[pointer]
-                pointer += 1
-
-                diff = current - last
-                if diff == 1:
-                    last = current
-                elif diff > 1:
-                    if start == last:
-                        payload.write_byte(self.RECORD_TYPE_SINGLE)
-                        payload.write_triad(start, order=ByteOrder.LITTLE_ENDIAN)
-                    else:
-                        payload.write_byte(self.RECORD_TYPE_RANGE)
-                        payload.write_triad(start, order=ByteOrder.LITTLE_ENDIAN)
-                        payload.write_triad(last, order=ByteOrder.LITTLE_ENDIAN)
-
-                    start = last = current
-                    records += 1
-
-            if start == last:
-                payload.write_byte(self.RECORD_TYPE_SINGLE)
-                payload.write_triad(start, order=ByteOrder.LITTLE_ENDIAN)
-            else:
-                payload.write_byte(self.RECORD_TYPE_RANGE)
-                payload.write_triad(start, order=ByteOrder.LITTLE_ENDIAN)
-                payload.write_triad(last, order=ByteOrder.LITTLE_ENDIAN)
-            records += 1
+        if count == 0:
+            __out.write_short(0)
+            return
+
+        if np is not None:
+            self._encode_records_batch(__out)
+            return
+
+        # Scalar fallback: a pre-scan over the sorted ids counts the records,
+        # then one preallocated buffer is filled and written in a single call
+        # instead of going through a scratch BinaryStream.
+        packets = self.packets
+        records = 1
+        for index in range(1, count):
+            if packets[index] - packets[index - 1] > 1:
+                records += 1
+
+        buf = bytearray(2 + records * 7)
+        struct.pack_into('>H', buf, 0, records)
+        offset = 2
+
+        start = last = packets[0]
+        for index in range(1, count):
+            current = packets[index]
+            diff = current - last
+            if diff == 1:
+                last = current
+            elif diff > 1:
+                offset = self._pack_record(buf, offset, start, last)
+                start = last = current
+        offset = self._pack_record(buf, offset, start, last)
+
+        __out.write(memoryview(buf)[:offset])
+
+    def _pack_record(self, buf: bytearray, offset: int, start: int, end: int) -> int:
+        if start == end:
+            buf[offset] = self.RECORD_TYPE_SINGLE
+            buf[offset + 1:offset + 4] = start.to_bytes(3, 'little')
+            return offset + 4
+
+        buf[offset] = self.RECORD_TYPE_RANGE
+        buf[offset + 1:offset + 4] = start.to_bytes(3, 'little')
+        buf[offset + 4:offset + 7] = end.to_bytes(3, 'little')
+        return offset + 7
+
+    def _encode_records_batch(self, __out: PacketSerializer) -> None:
+        # Find run boundaries with one C-level scan instead of a Python loop,
+        # then emit all records into a single preallocated buffer.
+        arr = np.fromiter(self.packets, dtype=np.uint32, count=len(self.packets))
+        if segment_runs is not None:
+            run_starts, run_ends = segment_runs(arr)
+            starts = run_starts.tolist()
+            ends = run_ends.tolist()
+        else:
+            # Only gaps (> 1) break a run; duplicates (diff == 0) collapse
+            # into the run, matching the scalar loop and segment_runs.
+            breaks = np.nonzero(np.diff(arr) > 1)[0]
+            starts = arr[np.concatenate(([0], breaks + 1))].tolist()
+            ends = arr[np.concatenate((breaks, [len(arr) - 1]))].tolist()
 
-        __out.write_short(records)
-        __out.write(payload.buffer)
+        buf = bytearray(2 + len(starts) * 7)
+        struct.pack_into('>H', buf, 0, len(starts))
 
-    def decode_payload(self, __in: PacketSerializer) -> None:
-        self.packets.clear()
+        offset = 2
+        for start, end in zip(starts, ends):
+            offset = self._pack_record(buf, offset, start, end)
 
+        __out.write(memoryview(buf)[:offset])
+
+    def decode_payload(self, __in: PacketSerializer) -> None:
         records = __in.read_short()
-        count = 0
 
-        i = 0
-        while i < records and not __in.feos() and count < 4096:
-            if __in.read_byte() == self.RECORD_TYPE_SINGLE:
-                start = __in.read_triad(order=ByteOrder.LITTLE_ENDIAN)
-                end = __in.read_triad(order=ByteOrder.LITTLE_ENDIAN)
-                if (end - start) > 512:
+        # Pull the rest of the payload out once and walk it with plain offset
+        # arithmetic; the variable record sizes (4 or 7 bytes) rule out a
+        # fixed-stride bulk parse, but this keeps the loop free of stream
+        # method dispatch and expands ranges at C level.
+        raw = __in.read(len(__in.buffer) - __in.offset)
+        length = len(raw)
+
+        # Sizing pass: walk the records once to learn the exact id count so
+        # the list below is allocated in one go instead of growth-copied.
+        offset = 0
+        total = 0
+        parsed = 0
+        for _ in range(records):
+            if offset >= length or total >= 4096:
+                break
+
+            if raw[offset] == self.RECORD_TYPE_RANGE:
+                # A truncated record would slice short and decode as 0,
+                # corrupting the count below; stop at the last whole record.
+                if offset + 7 > length:
+                    break
+                start = int.from_bytes(raw[offset + 1:offset + 4], 'little')
+                end = int.from_bytes(raw[offset + 4:offset + 7], 'little')
+                # Clamp malformed and oversized ranges: end < start would
+                # subtract from the total and shrink the presized list.
+                if end < start:
+                    end = start
+                elif (end - start) > 512:
                     end = start + 512
-                for j in range(start, end + 1):
-                    self.packets[count] = j
-                    count += 1
+                total += end - start + 1
+                offset += 7
             else:
-                self.packets[count] = __in.read_triad(order=ByteOrder.LITTLE_ENDIAN)
+                if offset + 4 > length:
+                    break
+                total += 1
+                offset += 4
+            parsed += 1
+
+        packets = [0] * total
+
+        # Fill pass: slice-assign ranges straight into the presized list.
+        offset = 0
+        count = 0
+        for _ in range(parsed):
+            record_type = raw[offset]
+            offset += 1
+
+            if record_type == self.RECORD_TYPE_RANGE:
+                start = int.from_bytes(raw[offset:offset + 3], 'little')
+                end = int.from_bytes(raw[offset + 3:offset + 6], 'little')
+                offset += 6
+                # Mirror the sizing-pass clamps so both passes agree on size.
+                if end < start:
+                    end = start
+                elif (end - start) > 512:
+                    end = start + 512
+                size = end - start + 1
+                packets[count:count + size] = range(start, end + 1)
+                count += size
+            else:
+                packets[count] = int.from_bytes(raw[offset:offset + 3], 'little')
+                offset += 3
                 count += 1
-            i += 1
+
+        self.packets = packets
 
@@ -1,18 +1,30 @@
-import copy
-from typing import Self
+from typing import Final, Self
 
 from .other import InternetAddress, MessageIdentifiers
 from .packet import Packet, OnlinePacket, OfflinePacket, AcknowledgePacket, PacketSerializer
 from .raknet import RakNet
 
+# Shared zero padding for MTU discovery; slicing it is a single memcpy
+# instead of allocating a fresh up-to-MTU-sized bytes object per encode.
+_ZERO_PAD: Final[bytes] = bytes(1500)
+
+# Shared placeholder for the unused system-address slots; the instance is
+# treated as immutable, so every packet can reference the same one instead
+# of constructing or copying a dummy per slot.
+_DUMMY_ADDR: Final[InternetAddress] = InternetAddress('0.0.0.0', 0, 4)
+
 
 class ACK(AcknowledgePacket):
     ID = 0xc0
 
+    __slots__ = ()
+
 
 class AdvertiseSystem(Packet):
     ID = MessageIdentifiers.ADVERTISE_SYSTEM
 
+    __slots__ = ('response',)
+
     response: str
 
     def encode_payload(self, __out: PacketSerializer) -> None:
@@ -25,6 +37,8 @@ class AdvertiseSystem(Packet):
 class ConnectedPing(OnlinePacket):
     ID = MessageIdentifiers.CONNECTED_PING
 
+    __slots__ = ('send_time',)
+
     send_time: int
 
     @classmethod
@@ -43,6 +57,8 @@ class ConnectedPing(OnlinePacket):
 class ConnectedPong(OnlinePacket):
     ID = MessageIdentifiers.CONNECTED_PONG
 
+    __slots__ = ('send_time', 'receive_time')
+
     send_time: int
     receive_time: int
 
@@ -65,6 +81,8 @@ class ConnectedPong(OnlinePacket):
 class ConnectionRequest(OnlinePacket):
     ID = MessageIdentifiers.CONNECTION_REQUEST
 
+    __slots__ = ('client_id', 'send_time', 'use_security')
+
     client_id: int
     send_time: int
     use_security: bool
@@ -83,6 +101,8 @@ class ConnectionRequest(OnlinePacket):
 class ConnectionRequestAccepted(OnlinePacket):
     ID = MessageIdentifiers.CONNECTION_REQUEST_ACCEPTED
 
+    __slots__ = ('address', 'system_address', 'send_time', 'receive_time')
+
     address: InternetAddress
     system_address: list[InternetAddress]
     send_time: int
@@ -98,15 +118,14 @@ class ConnectionRequestAccepted(OnlinePacket):
         return result
 
     def __init__(self):
-        self.system_address.append(InternetAddress('127.0.0.1', 0, 4))
+        self.system_address = [InternetAddress('127.0.0.1', 0, 4)]
 
     def encode_payload(self, __out: PacketSerializer) -> None:
         __out.write_address(self.address)
         __out.write_short(0)
 
-        dummy = InternetAddress('0.0.0.0', 0, 4)
         for _ in range(RakNet.SYSTEM_ADDRESS_COUNT):
-            __out.write_address(dummy)
+            __out.write_address(_DUMMY_ADDR)
 
         __out.write_long(self.send_time)
         __out.write_long(self.receive_time)
@@ -116,9 +135,8 @@ class ConnectionRequestAccepted(OnlinePacket):
         __in.read_short()  # TODO: Check this
 
         length = len(__in.buffer)
-        dummy = InternetAddress('0.0.0.0', 0, 4)
         for i in range(RakNet.SYSTEM_ADDRESS_COUNT):
-            self.system_address.append(__in.read_address() if (__in.offset + 16) < length else dummy)
+            self.system_address.append(__in.read_address() if (__in.offset + 16) < length else _DUMMY_ADDR)
 
         self.send_time = __in.read_long()
         self.receive_time = __in.read_long()
@@ -127,6 +145,8 @@ class ConnectionRequestAccepted(OnlinePacket):
 class DisconnectNotification(OnlinePacket):
     ID = MessageIdentifiers.DISCONNECT_NOTIFICATION
 
+    __slots__ = ()
+
     def encode_payload(self, __out: PacketSerializer) -> None:
         pass
 
@@ -137,6 +157,8 @@ class DisconnectNotification(OnlinePacket):
 class IncompatibleProtocolVersion(OfflinePacket):
     ID = MessageIdentifiers.INCOMPATIBLE_PROTOCOL_VERSION
 
+    __slots__ = ('protocol', 'server_id')
+
     protocol: int
     server_id: int
 
@@ -161,10 +183,14 @@ class IncompatibleProtocolVersion(OfflinePacket):
 class NACK(AcknowledgePacket):
     ID = 0xa0
 
+    __slots__ = ()
+
 
 class NewIncomingConnection(OnlinePacket):
     ID = MessageIdentifiers.NEW_INCOMING_CONNECTION
 
+    __slots__ = ('address', 'system_address', 'send_time', 'receive_time')
+
     address: InternetAddress
     system_address: list[InternetAddress]
     send_time: int
@@ -182,9 +208,9 @@ class NewIncomingConnection(OnlinePacket):
         self.address = __in.read_address()
 
         end_offset = len(__in.buffer) - 16
-        dummy = InternetAddress('0.0.0.0', 0, 4)
+        self.system_address = []
         for i in range(RakNet.SYSTEM_ADDRESS_COUNT):
-            value = copy.copy(dummy) if (__in.offset >= end_offset) else __in.read_address()
+            value = _DUMMY_ADDR if (__in.offset >= end_offset) else __in.read_address()
             self.system_address.append(value)
 
         self.send_time = __in.read_long()
@@ -194,6 +220,8 @@ class NewIncomingConnection(OnlinePacket):
 class OpenConnectionReplyOne(OfflinePacket):
     ID = MessageIdentifiers.OPEN_CONNECTION_REPLY_ONE
 
+    __slots__ = ('server_id', 'use_security', 'mtu_size')
+
     server_id: int
     use_security: bool
     mtu_size: int
@@ -222,6 +250,8 @@ class OpenConnectionReplyOne(OfflinePacket):
 class OpenConnectionReplyTwo(OfflinePacket):
     ID = MessageIdentifiers.OPEN_CONNECTION_REPLY_TWO
 
+    __slots__ = ('server_id', 'client_address', 'mtu_size', 'use_security')
+
     server_id: int
     client_address: InternetAddress
     mtu_size: int
@@ -254,15 +284,21 @@ class OpenConnectionReplyTwo(OfflinePacket):
 class OpenConnectionRequestOne(OfflinePacket):
     ID = MessageIdentifiers.OPEN_CONNECTION_REQUEST_ONE
 
-    protocol: int = RakNet.DEFAULT_PROTOCOL_VERSION
+    __slots__ = ('protocol', 'mtu_size')
+
+    protocol: int
     mtu_size: int
 
+    def __init__(self):
+        super().__init__()
+        self.protocol = RakNet.DEFAULT_PROTOCOL_VERSION
+
     def encode_payload(self, __out: PacketSerializer) -> None:
         self.write_magic(__out)
         __out.write_byte(self.protocol)
 
         length = self.mtu_size - 46
-        __out.write(b'\x00' * length)
+        __out.write(memoryview(_ZERO_PAD)[:length])
 
     def decode_payload(self, __in: PacketSerializer) -> None:
         self.read_magic(__in)
@@ -273,6 +309,8 @@ class OpenConnectionRequestOne(OfflinePacket):
 class OpenConnectionRequestTwo(OfflinePacket):
     ID = MessageIdentifiers.OPEN_CONNECTION_REQUEST_TWO
 
+    __slots__ = ('client_id', 'server_address', 'mtu_size')
+
     client_id: int
     server_address: InternetAddress
     mtu_size: int
@@ -293,6 +331,8 @@ class OpenConnectionRequestTwo(OfflinePacket):
 class UnconnectedPing(OfflinePacket):
     ID = MessageIdentifiers.UNCONNECTED_PING
 
+    __slots__ = ('send_time', 'client_id')
+
     send_time: int
     client_id: int
 
@@ -310,12 +350,16 @@ class UnconnectedPing(OfflinePacket):
 
 
 class UnconnectedPingOpenConnections(UnconnectedPing):
-    ID: MessageIdentifiers.UNCONNECTED_PING_OPEN_CONNECTIONS
+    ID = MessageIdentifiers.UNCONNECTED_PING_OPEN_CONNECTIONS
+
+    __slots__ = ()
 
 
 class UnconnectedPong(OfflinePacket):
     ID = MessageIdentifiers.UNCONNECTED_PONG
 
+    __slots__ = ('send_time', 'server_id', 'response')
+
     send_time: int
     server_id: int
     response: str
@@ -339,3 +383,30 @@ class UnconnectedPong(OfflinePacket):
         self.server_id = __in.read_long()
         self.read_magic(__in)
         self.response = __in.read_string()
+
+
+# Decode dispatch table: the receive loop resolves the packet class straight
+# from the first byte of the datagram (PACKET_BY_ID.get(buffer[0])) instead
+# of walking an if/elif chain per packet.
+PACKET_BY_ID: dict[int, type[Packet]] = {
+    cls.ID: cls
+    for cls in (
+        ACK,
+        NACK,
+        AdvertiseSystem,
+        ConnectedPing,
+        ConnectedPong,
+        ConnectionRequest,
+        ConnectionRequestAccepted,
+        DisconnectNotification,
+        IncompatibleProtocolVersion,
+        NewIncomingConnection,
+        OpenConnectionReplyOne,
+        OpenConnectionReplyTwo,
+        OpenConnectionRequestOne,
+        OpenConnectionRequestTwo,
+        UnconnectedPing,
+        UnconnectedPingOpenConnections,
+        UnconnectedPong,
+    )
+}
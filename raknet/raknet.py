@@ -1,11 +1,15 @@
-from typing import Final
+from typing import final
 
 __all__ = [
     "RakNet"
 ]
 
 
-class RakNet(Final):
+# typing.Final is not a legal base class (subclassing it raises TypeError
+# at import on current Python); the decorator marks the class final for
+# type checkers without dragging typing machinery into the MRO.
+@final
+class RakNet:
     # Default vanilla RakNet protocol version that this library implements. Things using RakNet can override this
     # protocol version with something different.
     DEFAULT_PROTOCOL_VERSION = 6
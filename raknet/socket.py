@@ -1,16 +1,98 @@
+import asyncio
+import ctypes
 import errno
+import struct
 import socket
+import sys
 from abc import ABC
-from typing import Self, Optional
+from typing import Callable, Self, Optional
 
 from .other import InternetAddress
 
+try:
+    # Optional: drop-in faster event loop for the sharded reader setup.
+    import uvloop
+except ImportError:
+    uvloop = None
+
 __all__ = [
     'ClientSocket',
     'ServerSocket',
 ]
 
 
+# Linux recvmmsg(2) binding used by ServerSocket.read_packets to pull a whole
+# burst of datagrams out of the kernel with a single syscall. On other
+# platforms (or exotic libcs) _recvmmsg stays None and a recvfrom_into loop
+# is used instead.
+class _iovec(ctypes.Structure):
+    _fields_ = [
+        ('iov_base', ctypes.c_void_p),
+        ('iov_len', ctypes.c_size_t),
+    ]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_name', ctypes.c_void_p),
+        ('msg_namelen', ctypes.c_uint32),
+        ('msg_iov', ctypes.POINTER(_iovec)),
+        ('msg_iovlen', ctypes.c_size_t),
+        ('msg_control', ctypes.c_void_p),
+        ('msg_controllen', ctypes.c_size_t),
+        ('msg_flags', ctypes.c_int),
+    ]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [
+        ('msg_hdr', _msghdr),
+        ('msg_len', ctypes.c_uint),
+    ]
+
+
+_recvmmsg = None
+_sendmmsg = None
+if sys.platform == 'linux':
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        _recvmmsg = _libc.recvmmsg
+        _recvmmsg.restype = ctypes.c_int
+        _recvmmsg.argtypes = [
+            ctypes.c_int, ctypes.POINTER(_mmsghdr), ctypes.c_uint,
+            ctypes.c_int, ctypes.c_void_p
+        ]
+        _sendmmsg = _libc.sendmmsg
+        _sendmmsg.restype = ctypes.c_int
+        _sendmmsg.argtypes = [
+            ctypes.c_int, ctypes.POINTER(_mmsghdr), ctypes.c_uint,
+            ctypes.c_int
+        ]
+    except (OSError, AttributeError):
+        _recvmmsg = None
+        _sendmmsg = None
+
+
+_SOCKADDR_STORAGE_SIZE = 128
+
+
+def _parse_sockaddr(raw: bytes) -> tuple[str, int]:
+    family = struct.unpack_from('=H', raw, 0)[0]
+    port = struct.unpack_from('!H', raw, 2)[0]
+    if family == socket.AF_INET6:
+        return socket.inet_ntop(socket.AF_INET6, raw[8:24]), port
+    return socket.inet_ntop(socket.AF_INET, raw[4:8]), port
+
+
+def _pack_sockaddr(ip: str, port: int) -> bytes:
+    if ':' in ip:
+        return struct.pack(
+            '=HHI16sI', socket.AF_INET6, socket.htons(port), 0,
+            socket.inet_pton(socket.AF_INET6, ip), 0
+        )
+    return struct.pack('=HH4s8x', socket.AF_INET, socket.htons(port), socket.inet_aton(ip))
+
+
 class Socket(ABC):
     def __init__(self, ipv6: bool):
         try:
@@ -74,9 +156,23 @@ class ClientSocket(Socket):
         return result
 
 
+class _DatagramReader(asyncio.DatagramProtocol):
+    def __init__(self, server: 'ServerSocket', handler: Callable[['ServerSocket', bytes, tuple[str, int]], None]):
+        self.server = server
+        self.handler = handler
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self.handler(self.server, data, addr)
+
+
 class ServerSocket(Socket):
-    def __init__(self, address: InternetAddress):
+    MAX_DATAGRAM_SIZE = 65535
+
+    def __init__(self, address: InternetAddress, reuse_port: bool = False):
         super().__init__(address.version == 6)
+        self.address = address
+        if reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
         try:
             self.socket.bind((address.ip, address.port))
         except socket.error as e:
@@ -85,19 +181,129 @@ class ServerSocket(Socket):
                 raise RuntimeError(f"Failed to bind socket. Something else is already running on {address.ip}:{address.port} (code {code}):", message.strip())
             raise RuntimeError(f"Failed to bind to {address.ip}:{address.port} (code {code}):", message.strip())
 
+        # Reusable receive buffer so each datagram only allocates its actual
+        # payload instead of a fresh 64 KiB bytes object per recvfrom.
+        self._rx_buf = bytearray(self.MAX_DATAGRAM_SIZE)
+        self._rx_view = memoryview(self._rx_buf)
+
+        # Batch receive state, built lazily on the first read_packets call.
+        self._batch = None
+
     def set_broadcast(self, broadcast: bool) -> bool:
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1 if broadcast else 0)
         return broadcast
 
+    @classmethod
+    def spawn_readers(cls, address: InternetAddress, count: int,
+                      handler: Callable[['ServerSocket', bytes, tuple[str, int]], None]) -> None:
+        """Serve ``count`` readers sharing ``address`` via SO_REUSEPORT.
+
+        The kernel distributes inbound datagrams across the sockets by
+        flow hash, so receive processing scales with the number of
+        readers; each one runs as an asyncio datagram endpoint (under
+        uvloop when installed). Blocks until cancelled; ``handler`` is
+        called as handler(server, data, (ip, port)).
+        """
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        async def _serve() -> None:
+            loop = asyncio.get_running_loop()
+            servers = []
+            transports = []
+            for _ in range(count):
+                server = cls(address, reuse_port=True)
+                server.set_blocking(False)
+                transport, _ = await loop.create_datagram_endpoint(
+                    lambda server=server: _DatagramReader(server, handler),
+                    sock=server.socket
+                )
+                servers.append(server)
+                transports.append(transport)
+
+            try:
+                await asyncio.Event().wait()
+            finally:
+                for transport in transports:
+                    transport.close()
+                for server in servers:
+                    server.close()
+
+        asyncio.run(_serve())
+
     def read_packet(self) -> Optional[bytes]:
         try:
-            buffer = self.socket.recvfrom(65535, 0)
+            nbytes, _ = self.socket.recvfrom_into(self._rx_buf, self.MAX_DATAGRAM_SIZE)
         except socket.error as e:
             code, message = e.args
             if code == errno.EWOULDBLOCK:
                 return None
             raise RuntimeError(f"Failed to recv (code {code}):", message.strip())
-        return buffer[0]
+        return bytes(self._rx_view[:nbytes])
+
+    BATCH_DATAGRAM_SIZE = 2048
+
+    def _init_batch(self, size: int) -> None:
+        buffers = [bytearray(self.BATCH_DATAGRAM_SIZE) for _ in range(size)]
+        names = [ctypes.create_string_buffer(_SOCKADDR_STORAGE_SIZE) for _ in range(size)]
+        iovecs = (_iovec * size)()
+        headers = (_mmsghdr * size)()
+
+        for i in range(size):
+            iovecs[i].iov_base = ctypes.addressof(ctypes.c_char.from_buffer(buffers[i]))
+            iovecs[i].iov_len = self.BATCH_DATAGRAM_SIZE
+            headers[i].msg_hdr.msg_name = ctypes.addressof(names[i])
+            headers[i].msg_hdr.msg_namelen = _SOCKADDR_STORAGE_SIZE
+            headers[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+            headers[i].msg_hdr.msg_iovlen = 1
+
+        self._batch = (buffers, names, iovecs, headers)
+
+    def read_packets(self, max_batch: int = 32) -> list[tuple[bytes, tuple[str, int]]]:
+        """Receive up to ``max_batch`` datagrams with one recvmmsg syscall.
+
+        Falls back to a recvfrom_into loop where recvmmsg is unavailable.
+        Returns an empty list when no datagram is pending.
+        """
+        if _recvmmsg is None:
+            return self._read_packets_fallback(max_batch)
+
+        if self._batch is None or len(self._batch[3]) < max_batch:
+            self._init_batch(max_batch)
+        buffers, names, _, headers = self._batch
+
+        for i in range(max_batch):
+            headers[i].msg_hdr.msg_namelen = _SOCKADDR_STORAGE_SIZE
+
+        count = _recvmmsg(self.socket.fileno(), headers, max_batch, 0, None)
+        if count < 0:
+            code = ctypes.get_errno()
+            if code in (errno.EWOULDBLOCK, errno.EAGAIN, errno.EINTR):
+                return []
+            raise RuntimeError(f"Failed to recvmmsg (code {code}):", errno.errorcode.get(code, '?'))
+
+        result = []
+        for i in range(count):
+            address = _parse_sockaddr(names[i].raw)
+            result.append((bytes(buffers[i][:headers[i].msg_len]), address))
+        return result
+
+    def _read_packets_fallback(self, max_batch: int) -> list[tuple[bytes, tuple[str, int]]]:
+        result = []
+        for _ in range(max_batch):
+            try:
+                nbytes, address = self.socket.recvfrom_into(self._rx_buf, self.MAX_DATAGRAM_SIZE)
+            except socket.error as e:
+                code = e.args[0]
+                if code == errno.EWOULDBLOCK:
+                    break
+                raise RuntimeError(f"Failed to recv (code {code}):", e.args[1].strip())
+            result.append((bytes(self._rx_view[:nbytes]), address))
+            if self.socket.getblocking():
+                # A blocking socket would stall the loop waiting for the
+                # next datagram; hand back what we have.
+                break
+        return result
 
     def write_packet(self, buffer: bytes, ip: str, port: int) -> int:
         try:
@@ -106,3 +312,48 @@ class ServerSocket(Socket):
             code, message = e.args
             raise RuntimeError(f"Failed to send to {ip}:{port} (code {code}):", message.strip())
         return result
+
+    MAX_TX_BATCH = 64
+
+    def write_packets(self, items: list[tuple[bytes, str, int]]) -> int:
+        """Send a burst of (buffer, ip, port) datagrams with sendmmsg(2).
+
+        Collapses one syscall per datagram into one per MAX_TX_BATCH burst;
+        falls back to a sendto loop where sendmmsg is unavailable. Returns
+        the number of datagrams sent.
+        """
+        if _sendmmsg is None:
+            for buffer, ip, port in items:
+                self.write_packet(buffer, ip, port)
+            return len(items)
+
+        sent = 0
+        while sent < len(items):
+            chunk = items[sent:sent + self.MAX_TX_BATCH]
+            size = len(chunk)
+
+            iovecs = (_iovec * size)()
+            headers = (_mmsghdr * size)()
+            names = []
+            for i, (buffer, ip, port) in enumerate(chunk):
+                packed = _pack_sockaddr(ip, port)
+                name = ctypes.create_string_buffer(packed, len(packed))
+                names.append(name)
+                iovecs[i].iov_base = ctypes.cast(ctypes.c_char_p(buffer), ctypes.c_void_p)
+                iovecs[i].iov_len = len(buffer)
+                headers[i].msg_hdr.msg_name = ctypes.addressof(name)
+                headers[i].msg_hdr.msg_namelen = ctypes.sizeof(name)
+                headers[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+                headers[i].msg_hdr.msg_iovlen = 1
+
+            result = _sendmmsg(self.socket.fileno(), headers, size, 0)
+            if result < 0:
+                code = ctypes.get_errno()
+                if code in (errno.EWOULDBLOCK, errno.EAGAIN) and sent > 0:
+                    break
+                raise RuntimeError(f"Failed to sendmmsg (code {code}):", errno.errorcode.get(code, '?'))
+            sent += result
+            if result < size:
+                # Partial send (socket buffer full); retry the remainder.
+                continue
+        return sent